@@ -7,6 +7,10 @@ performance, and maintainability.
 """
 
 import argparse
+import atexit
+import collections
+import contextlib
+import functools
 import json
 import logging
 import os
@@ -15,9 +19,13 @@ import shutil
 import socket
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Deque, Dict, Iterator, List, Optional, Tuple, Any, Union
+from urllib.parse import urlsplit
 
 
 # Configuration constants
@@ -47,10 +55,138 @@ SUPPORTED_PLATFORMS = {
     'other': []
 }
 
+# Root for all output folders (resolved once at import)
+_DOWNLOADS_DIR = Path.home() / "Downloads"
+
+# Upper bound for --jobs; more concurrent downloads tend to trigger YouTube rate limiting
+MAX_PARALLEL_JOBS = 4
+
+# Output template for batch downloads, mirroring create_output_dir's
+# "YYYY.MM.DD - <Video Title>" folders (falls back to the extraction date)
+BATCH_OUTPUT_TEMPLATE = (
+    "%(upload_date>%Y.%m.%d,release_date>%Y.%m.%d,epoch>%Y.%m.%d)s - %(title).100s/"
+    "%(title)s [%(id)s].%(ext)s"
+)
+
+# Install/profile locations used to check a cookie browser is present (expanded at import)
+_BROWSER_PROFILE_PATHS = {
+    'firefox': tuple(os.path.expanduser(p) for p in [
+        '/Applications/Firefox.app',
+        '~/.mozilla/firefox',
+        '/usr/bin/firefox'
+    ])
+}
+
+# Reverse lookup of SUPPORTED_PLATFORMS: registered domain -> platform
+_DOMAIN_TO_PLATFORM = {
+    domain: platform
+    for platform, domains in SUPPORTED_PLATFORMS.items()
+    for domain in domains
+}
+
+# Characters stripped from titles for filesystem compatibility (str.translate table)
+_FN_STRIP = str.maketrans('', '', '\\/:*?"<>|')
+
+# URL scheme prefix ("https://"), used to recognise bare "host/path" input
+_URL_SCHEME_RE = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*://')
+
+# Precompiled patterns for `yt-dlp -F` output parsing
+_FORMAT_ID_RE = re.compile(r'^(\d+)\s+')
+_RESOLUTION_RE = re.compile(r'(\d+)x(\d+)')
+
+# yt-dlp error phrases indicating PO Token / SABR streaming problems (one scan each)
+_POT_ERROR_RE = re.compile(r'PO Token|po_token|requires a GVS PO Token')
+_SABR_ERROR_RE = re.compile(
+    r'web client https formats require a GVS PO Token'
+    r'|YouTube is forcing SABR streaming'
+    r'|only SABR formats'
+)
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# shutil.which results, keyed by executable name (PATH doesn't change within a run)
+_WHICH_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _cached_which(name: str) -> Optional[str]:
+    """Return shutil.which(name), walking PATH at most once per name."""
+    if name not in _WHICH_CACHE:
+        _WHICH_CACHE[name] = shutil.which(name)
+    return _WHICH_CACHE[name]
+
+
+@functools.lru_cache(maxsize=None)
+def _platform_for_url(url: str) -> str:
+    """Map a URL to a SUPPORTED_PLATFORMS key by its host name."""
+    # Bare "youtu.be/ID" style input has no scheme, so urlsplit would see no host
+    if not _URL_SCHEME_RE.match(url):
+        url = f'//{url}'
+    try:
+        host = urlsplit(url).hostname or ''
+    except ValueError:  # e.g. malformed IPv6 host
+        return 'other'
+
+    # Match the host and each parent domain, so m.youtube.com and
+    # music.youtube.com resolve the same as youtube.com
+    labels = host.split('.')
+    for i in range(len(labels) - 1):
+        platform = _DOMAIN_TO_PLATFORM.get('.'.join(labels[i:]))
+        if platform:
+            return platform
+    return 'other'
+
+
+@functools.lru_cache(maxsize=None)
+def _browser_present(name: str) -> bool:
+    """Return False only if none of the known locations for a browser exist."""
+    paths = _BROWSER_PROFILE_PATHS.get(name)
+    if paths is None:
+        return True  # No known locations to check
+    return any(os.path.exists(p) for p in paths)
+
+
+def _cache_probe(func):
+    """Memoize an environment probe method for the lifetime of the process.
+
+    The cache is keyed on the call arguments only (not ``self``), so results are
+    shared by every VideoDownloader instance and by fallback download attempts.
+    Probes run from thread pools, so concurrent callers wait for the first one
+    instead of all probing at once; the lock is per probe, so different probes
+    still run in parallel.
+    """
+    cache: Dict[Tuple[Any, ...], Any] = {}
+    lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        with lock:
+            if key not in cache:
+                cache[key] = func(self, *args, **kwargs)
+            return cache[key]
+
+    return wrapper
+
+
+class _KillTimer(threading.Timer):
+    """Timer that kills a process when it expires.
+
+    ``timed_out`` is set before the kill, so a wait() that returns because of
+    the kill can never observe the timeout as unset. The thread is a daemon so a
+    pending timer never keeps the interpreter alive after an interrupt.
+    """
+
+    def __init__(self, interval: float, proc: subprocess.Popen):
+        super().__init__(interval, self._expire, args=(proc,))
+        self.daemon = True
+        self.timed_out = threading.Event()
+
+    def _expire(self, proc: subprocess.Popen) -> None:
+        self.timed_out.set()
+        proc.kill()
+
 
 class YtDlpWrapperError(Exception):
     """Custom exception for wrapper-specific errors."""
@@ -62,6 +198,10 @@ class VideoDownloader:
     
     def __init__(self, cookies_browser: str = 'firefox'):
         self.cookies_browser = cookies_browser
+        self._cookie_dir: Optional[str] = None
+        self._cookie_jar: Optional[str] = None
+        self._cookies_exported = False
+        self._cookie_lock = threading.Lock()
         self._validate_dependencies()
     
     def _validate_dependencies(self) -> None:
@@ -73,25 +213,81 @@ class VideoDownloader:
                 "Please upgrade Python."
             )
 
-        if not shutil.which('yt-dlp'):
+        if not _cached_which('yt-dlp'):
             raise YtDlpWrapperError(
                 "yt-dlp not found. Install with: uv pip install -U yt-dlp"
             )
         
         # Check if browser is available for cookie extraction
-        browser_paths = {
-            'firefox': [
-                '/Applications/Firefox.app',
-                '~/.mozilla/firefox',
-                '/usr/bin/firefox'
-            ]
-        }
-        
-        if self.cookies_browser in browser_paths:
-            paths = browser_paths[self.cookies_browser]
-            if not any(Path(p).expanduser().exists() for p in paths):
-                logger.warning(f"{self.cookies_browser} not found. Downloads may fail for authenticated content.")
+        if not _browser_present(self.cookies_browser):
+            logger.warning(f"{self.cookies_browser} not found. Downloads may fail for authenticated content.")
+
+    @contextlib.contextmanager
+    def _cookie_args(self, platform: str) -> Iterator[List[str]]:
+        """
+        Yield yt-dlp cookie arguments for a single yt-dlp call.
+        For YouTube (several yt-dlp calls per URL, plus fallback attempts) browser
+        cookies are exported once on first use; each call then gets its own copy of
+        the jar, because yt-dlp rewrites its --cookies file in place on exit and a
+        concurrent run could otherwise read it half-written. The copy is deleted when
+        the with block exits. Other platforms only make two or three calls, so they
+        read the browser directly.
+        """
+        browser_args = ['--cookies-from-browser', self.cookies_browser]
+        if platform != 'youtube':
+            yield browser_args
+            return
+
+        # Probes and --jobs downloads run concurrently, so only one of them may export
+        with self._cookie_lock:
+            if not self._cookies_exported:
+                self._cookie_jar = self._export_browser_cookies()
+                self._cookies_exported = True
+
+        if self._cookie_jar is None:
+            yield browser_args
+            return
+
+        fd, call_jar = tempfile.mkstemp(dir=self._cookie_dir, suffix='.cookies.txt')
+        try:
+            os.close(fd)
+            shutil.copyfile(self._cookie_jar, call_jar)
+            yield ['--cookies', call_jar]
+        finally:
+            Path(call_jar).unlink(missing_ok=True)
+
+    def _export_browser_cookies(self) -> Optional[str]:
+        """
+        Export browser cookies to a temporary cookie jar so later yt-dlp runs can use
+        --cookies instead of re-reading (and re-decrypting) the browser profile each time.
+        Returns the jar path, or None if the export failed.
+        """
+        # Private (0700) directory holding the exported jar and its per-call copies
+        self._cookie_dir = tempfile.mkdtemp(prefix='yt-dlp-wrapper-')
+        atexit.register(shutil.rmtree, self._cookie_dir, ignore_errors=True)
+        cookie_jar = os.path.join(self._cookie_dir, 'browser.cookies.txt')
+
+        # yt-dlp writes the loaded cookies to the --cookies file on exit, even if
+        # extraction of the placeholder URL itself fails. The URL resolves to the
+        # recommended feed, so --flat-playlist/--playlist-items 0 keep yt-dlp from
+        # extracting any of its videos.
+        cmd = ['yt-dlp', '--cookies-from-browser', self.cookies_browser, '--cookies', cookie_jar,
+               '--skip-download', '--flat-playlist', '--playlist-items', '0',
+               '--quiet', '--no-warnings', 'https://www.youtube.com']
+        try:
+            subprocess.run(cmd, capture_output=True, timeout=120)
+        except subprocess.SubprocessError as e:
+            logger.debug("Could not export %s cookies: %s", self.cookies_browser, e)
+            return None
 
+        if not os.path.exists(cookie_jar) or os.path.getsize(cookie_jar) == 0:
+            logger.debug("Could not export %s cookies, reading them per call instead", self.cookies_browser)
+            return None
+
+        logger.debug("Exported %s cookies to %s", self.cookies_browser, cookie_jar)
+        return cookie_jar
+
+    @_cache_probe
     def _check_javascript_runtime(self) -> Optional[str]:
         """Check for available JavaScript runtime for YouTube downloads."""
         # Runtimes in priority order (only deno is enabled by default in yt-dlp)
@@ -102,13 +298,33 @@ class VideoDownloader:
             'quickjs': '2023-12-9+'
         }
 
-        for runtime, version in runtimes.items():
-            if shutil.which(runtime):
-                logger.debug(f"Found JavaScript runtime: {runtime}")
+        if os.name == 'nt':
+            # Executables carry PATHEXT suffixes on Windows; let shutil.which resolve them
+            found = {runtime for runtime in runtimes if _cached_which(runtime)}
+        else:
+            # Walk PATH once, listing each directory, rather than one which() walk per runtime
+            found = set()
+            for directory in os.environ.get('PATH', '').split(os.pathsep):
+                try:
+                    entries = set(os.listdir(directory or '.'))
+                except OSError:
+                    continue
+                for runtime in (runtimes.keys() & entries) - found:
+                    # Like shutil.which, skip directories that happen to share the name
+                    path = os.path.join(directory, runtime)
+                    if os.path.isfile(path) and os.access(path, os.X_OK):
+                        found.add(runtime)
+                if len(found) == len(runtimes):
+                    break
+
+        for runtime in runtimes:
+            if runtime in found:
+                logger.debug("Found JavaScript runtime: %s", runtime)
                 return runtime
 
         return None
 
+    @_cache_probe
     def _check_pot_plugin_installed(self) -> bool:
         """Check if bgutil-ytdlp-pot-provider plugin is installed."""
         try:
@@ -116,7 +332,7 @@ class VideoDownloader:
             uv_cmd = ['uv', 'pip', 'show', 'bgutil-ytdlp-pot-provider']
             pip_cmd = [sys.executable, '-m', 'pip', 'show', 'bgutil-ytdlp-pot-provider']
 
-            cmd = uv_cmd if shutil.which('uv') else pip_cmd
+            cmd = uv_cmd if _cached_which('uv') else pip_cmd
 
             result = subprocess.run(
                 cmd,
@@ -129,30 +345,28 @@ class VideoDownloader:
                 return True
             return False
         except (subprocess.SubprocessError, Exception) as e:
-            logger.debug(f"Could not check PO Token plugin: {e}")
+            logger.debug("Could not check PO Token plugin: %s", e)
             return False
 
-    def _check_pot_server_running(self, host: str = '127.0.0.1', port: int = 4416, timeout: float = 1.0) -> bool:
+    @_cache_probe
+    def _check_pot_server_running(self, host: str = '127.0.0.1', port: int = 4416, timeout: float = 0.25) -> bool:
         """Check if the PO Token HTTP server is running."""
+        # Loopback connects complete in well under a millisecond when the server is up,
+        # so a short timeout only bounds the wait when it isn't
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            sock.close()
-            if result == 0:
-                logger.debug(f"PO Token HTTP server is running at {host}:{port}")
+            with socket.create_connection((host, port), timeout=timeout):
+                logger.debug("PO Token HTTP server is running at %s:%s", host, port)
                 return True
-            return False
-        except (socket.error, Exception) as e:
-            logger.debug(f"PO Token HTTP server check failed: {e}")
+        except OSError as e:  # includes socket.timeout and ConnectionRefusedError
+            logger.debug("PO Token HTTP server check failed: %s", e)
             return False
 
-    def _validate_pot_provider(self, url: str, pot_provider_mode: Optional[str] = None) -> Optional[str]:
+    def _validate_pot_provider(self, platform: str, pot_provider_mode: Optional[str] = None) -> Optional[str]:
         """
         Validate PO Token provider setup for YouTube downloads.
         Returns extractor args string if provider is configured, None otherwise.
         """
-        if self.detect_platform(url) != 'youtube':
+        if platform != 'youtube':
             return None
 
         # Check if plugin is installed
@@ -187,9 +401,9 @@ class VideoDownloader:
             )
             return None
 
-    def _validate_youtube_requirements(self, url: str) -> None:
+    def _validate_youtube_requirements(self, platform: str) -> None:
         """Validate YouTube-specific requirements like JavaScript runtime."""
-        if self.detect_platform(url) != 'youtube':
+        if platform != 'youtube':
             return
 
         runtime = self._check_javascript_runtime()
@@ -204,68 +418,92 @@ class VideoDownloader:
                 "   Alternatively: Node.js 20+, Bun, or QuickJS"
             )
 
-    def _run_command(self, cmd: str, capture_output: bool = True) -> Tuple[bool, str]:
-        """Run a shell command and return success status and output."""
-        try:
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=capture_output,
-                text=True,
-                check=True,
-                timeout=300  # 5 minute timeout
-            )
-            return True, result.stdout
-        except subprocess.TimeoutExpired:
-            logger.error("Command timed out after 5 minutes")
-            return False, ""
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Command failed with return code {e.returncode}")
-            if e.stderr:
-                logger.error(f"Error details: {e.stderr}")
-            return False, e.stderr or ""
-    
+    def _start_command(self, cmd: List[str], text: bool = False,
+                       timeout: float = 300) -> Tuple[subprocess.Popen, Any, _KillTimer]:
+        """
+        Start a command (argv list, no shell) whose stdout the caller reads as a stream.
+        Pass the returned handles to _finish_command once stdout has been consumed.
+        """
+        # stderr goes to a temp file so a chatty command can't fill the pipe and stall stdout
+        stderr_file = tempfile.TemporaryFile()
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file,
+                                text=text, bufsize=1 if text else -1)
+
+        # Reads from the stdout pipe have no timeout of their own, so kill the command if it overruns
+        watchdog = _KillTimer(timeout, proc)  # 5 minute timeout by default
+        watchdog.start()
+        return proc, stderr_file, watchdog
+
+    def _finish_command(self, proc: subprocess.Popen, stderr_file: Any,
+                        watchdog: _KillTimer) -> bool:
+        """Reap a command from _start_command, log any failure, and return success status."""
+        with stderr_file:
+            if proc.stdout:
+                proc.stdout.close()
+            try:
+                returncode = proc.wait()
+            finally:
+                watchdog.cancel()
+
+            if watchdog.timed_out.is_set():
+                logger.error(f"Command timed out after {watchdog.interval / 60:g} minutes")
+                return False
+
+            if returncode != 0:
+                logger.error(f"Command failed with return code {returncode}")
+                stderr_file.seek(0)
+                error_output = stderr_file.read().decode(errors='replace')
+                if error_output:
+                    logger.error(f"Error details: {error_output}")
+                return False
+
+        return True
+
     def get_video_info(self, url: str) -> Dict[str, Any]:
-        """Get video metadata as JSON."""
-        cmd = f'yt-dlp --cookies-from-browser {self.cookies_browser} -j "{url}"'
-        success, output = self._run_command(cmd)
-        
-        if not success or not output:
+        """Get video metadata as JSON, parsed directly from yt-dlp's stdout."""
+        info = None
+        parse_error = None
+        with self._cookie_args(self.detect_platform(url)) as cookie_args:
+            cmd = ['yt-dlp', *cookie_args, '-j', url]
+
+            proc, stderr_file, watchdog = self._start_command(cmd)
+            try:
+                info = json.load(proc.stdout)
+            except json.JSONDecodeError as e:
+                parse_error = e
+            finally:
+                success = self._finish_command(proc, stderr_file, watchdog)
+
+        if not success:
             logger.warning("Could not retrieve video information")
             return {}
-        
-        try:
-            return json.loads(output)
-        except json.JSONDecodeError as e:
-            logger.error(f"Could not parse video information: {e}")
+
+        if parse_error is not None:
+            logger.error(f"Could not parse video information: {parse_error}")
             return {}
-    
+
+        return info if isinstance(info, dict) else {}
+
     def detect_platform(self, url: str) -> str:
         """Detect the platform from the URL."""
-        url_lower = url.lower()
-        for platform, domains in SUPPORTED_PLATFORMS.items():
-            if any(domain in url_lower for domain in domains):
-                return platform
-        return 'other'
+        return _platform_for_url(url)
     
     def create_output_dir(self, title: str, date_str: Optional[str] = None) -> Path:
         """Create an output directory based on video title and date."""
-        # Format date
+        # Format date, falling back to today if missing or invalid
+        date = None
         if date_str:
             try:
-                date_fmt = datetime.strptime(date_str, '%Y%m%d').strftime('%Y.%m.%d')
+                date = datetime.strptime(date_str, '%Y%m%d')
             except ValueError:
                 logger.warning(f"Invalid date format: {date_str}")
-                date_fmt = datetime.now().strftime('%Y.%m.%d')
-        else:
-            date_fmt = datetime.now().strftime('%Y.%m.%d')
+        date_fmt = (date or datetime.now()).strftime('%Y.%m.%d')
         
         # Clean title for filesystem compatibility
-        clean_title = re.sub(r'[\\/:*?\"<>|]', '', title)
-        clean_title = clean_title.strip()[:100]  # Limit length
+        clean_title = title.translate(_FN_STRIP).strip()[:100]  # Limit length
         
         folder_name = f"{date_fmt} - {clean_title}"
-        output_dir = Path.home() / "Downloads" / folder_name
+        output_dir = _DOWNLOADS_DIR / folder_name
         
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -277,92 +515,68 @@ class VideoDownloader:
     def check_premium_formats(self, url: str) -> Optional[str]:
         """Check if any Premium formats are available for this video."""
         logger.info("Checking for Premium formats...")
-        cmd = f'yt-dlp --cookies-from-browser {self.cookies_browser} -F "{url}"'
-        success, output = self._run_command(cmd)
-        
-        if not success or not output:
-            logger.warning("Could not retrieve format list")
-            return None
-        
-        # Find the best Premium format (highest resolution)
+
+        # Find the best Premium format (highest resolution), parsing lines as yt-dlp emits them
         best_premium_id = None
         best_height = 0
-        
-        for line in output.split('\n'):
-            if 'Premium' not in line:
-                continue
-                
-            premium_match = re.search(r'^(\d+)\s+', line)
-            if not premium_match:
-                continue
-                
-            format_id = premium_match.group(1)
-            res_match = re.search(r'(\d+)x(\d+)', line)
-            height = int(res_match.group(2)) if res_match else 0
-            
-            if height > best_height:
-                best_premium_id = format_id
-                best_height = height
-        
+        got_output = False
+
+        with self._cookie_args(self.detect_platform(url)) as cookie_args:
+            cmd = ['yt-dlp', *cookie_args, '-F', url]
+
+            proc, stderr_file, watchdog = self._start_command(cmd, text=True)
+            try:
+                for line in proc.stdout:
+                    got_output = True
+                    if 'Premium' not in line:
+                        continue
+
+                    premium_match = _FORMAT_ID_RE.match(line)
+                    if not premium_match:
+                        continue
+
+                    format_id = premium_match.group(1)
+                    res_match = _RESOLUTION_RE.search(line)
+                    height = int(res_match.group(2)) if res_match else 0
+
+                    if height > best_height:
+                        best_premium_id = format_id
+                        best_height = height
+            finally:
+                success = self._finish_command(proc, stderr_file, watchdog)
+
+        if not success or not got_output:
+            logger.warning("Could not retrieve format list")
+            return None
+
         if not best_premium_id:
             logger.info("No Premium formats found, using default format selector")
             return None
-        
+
         logger.info(f"Best Premium format found: {best_premium_id} with resolution height {best_height}px")
         return f"{best_premium_id}+bestaudio/best"
 
-    def download_video(self, url: str, extra_args: Optional[List[str]] = None,
-                      format_selector: Optional[str] = None,
-                      youtube_client: Optional[str] = None,
-                      try_sabr: bool = False,
-                      try_fallback_clients: bool = False,
-                      prefer_premium: bool = True,
-                      sponsorblock_mark: Optional[str] = None,
-                      sponsorblock_remove: Optional[str] = None,
-                      embed_chapters: bool = False,
-                      sleep_interval: Optional[int] = None,
-                      sleep_subtitles: Optional[float] = None,
-                      pot_provider_mode: Optional[str] = None,
-                      pot_provider_url: Optional[str] = None,
-                      pot_provider_script: Optional[str] = None) -> bool:
-        """Download video using yt-dlp with optimized settings."""
-        if extra_args is None:
-            extra_args = []
-        
-        # Detect platform
-        platform = self.detect_platform(url)
-        logger.info(f"Detected platform: {platform.capitalize()}")
-
-        # Validate YouTube requirements (JavaScript runtime)
-        self._validate_youtube_requirements(url)
-
-        # Validate and configure PO Token provider for YouTube
-        self._validate_pot_provider(url, pot_provider_mode)
-
-        # Check for premium formats if YouTube and prefer_premium is enabled
-        if platform == 'youtube' and prefer_premium and not format_selector:
-            premium_format = self.check_premium_formats(url)
-            if premium_format:
-                format_selector = premium_format
-                logger.info(f"Using Premium format: {format_selector}")
-        
-        if format_selector is None:
-            format_selector = DEFAULT_FORMAT_SELECTOR
-        
-        # Get video metadata
-        logger.info("Fetching video metadata...")
-        info = self.get_video_info(url)
-        
-        # Create output directory
-        title = info.get('title', 'video')
-        date_str = info.get('upload_date') or info.get('release_date')
-        output_dir = self.create_output_dir(title, date_str)
-        logger.info(f"Output directory: {output_dir}")
-        
-        # Build command
+    def _build_download_cmd(self, url: Optional[str], format_selector: str, output_dir: Path,
+                            platform: str, extra_args: List[str],
+                            youtube_client: Optional[str] = None,
+                            try_sabr: bool = False,
+                            sponsorblock_mark: Optional[str] = None,
+                            sponsorblock_remove: Optional[str] = None,
+                            embed_chapters: bool = False,
+                            sleep_interval: Optional[int] = None,
+                            sleep_subtitles: Optional[float] = None,
+                            pot_provider_url: Optional[str] = None,
+                            pot_provider_script: Optional[str] = None,
+                            cookie_args: Optional[List[str]] = None) -> List[str]:
+        """
+        Build the yt-dlp download argv for a single attempt.
+        Pass url=None to leave the URL off (e.g. when URLs are fed via --batch-file).
+        Cookie arguments are only included if cookie_args is given; _execute_download
+        adds per-call cookies itself.
+        """
         base_cmd = [
             'yt-dlp',
-            '--cookies-from-browser', self.cookies_browser,
+            *(cookie_args or []),
             '-f', format_selector,
             '--write-auto-sub',
             '--sub-lang', 'en.*',
@@ -381,183 +595,318 @@ class VideoDownloader:
         if platform == 'youtube':
             if sponsorblock_mark:
                 base_cmd.extend(['--sponsorblock-mark', sponsorblock_mark])
-                logger.info(f"SponsorBlock: Marking categories: {sponsorblock_mark}")
+                logger.info("SponsorBlock: Marking categories: %s", sponsorblock_mark)
             if sponsorblock_remove:
                 base_cmd.extend(['--sponsorblock-remove', sponsorblock_remove])
-                logger.info(f"SponsorBlock: Removing categories: {sponsorblock_remove}")
+                logger.info("SponsorBlock: Removing categories: %s", sponsorblock_remove)
 
         # Add sleep interval for rate limiting
         if sleep_interval:
             base_cmd.extend(['--sleep-interval', str(sleep_interval)])
-            logger.info(f"Rate limiting: {sleep_interval} seconds between downloads")
+            logger.info("Rate limiting: %s seconds between downloads", sleep_interval)
 
         # Add sleep subtitles for subtitle download rate limiting
         if sleep_subtitles:
             base_cmd.extend(['--sleep-subtitles', str(sleep_subtitles)])
-            logger.info(f"Subtitle rate limiting: {sleep_subtitles} seconds between subtitle downloads")
-        
+            logger.info("Subtitle rate limiting: %s seconds between subtitle downloads", sleep_subtitles)
+
         # Add YouTube client option if specified and it's a YouTube URL
         if platform == 'youtube':
+            # Extractor args grouped by extractor key, serialized once below
+            extractor_args: Dict[str, List[str]] = {}
+
             # Handle YouTube SABR streaming format options
             if youtube_client:
-                logger.info(f"Using YouTube client: {youtube_client}")
-                base_cmd.extend(['--extractor-args', f"youtube:player-client={youtube_client}"])
-            
+                logger.info("Using YouTube client: %s", youtube_client)
+                extractor_args.setdefault('youtube', []).append(f"player-client={youtube_client}")
+
             # Enable SABR formats if requested
             if try_sabr:
                 logger.info("Enabling YouTube SABR format support")
-                formats_arg = "youtube:formats=duplicate"
-                if any(arg.startswith("--extractor-args") for arg in base_cmd):
-                    # Update existing extractor args
-                    for i, arg in enumerate(base_cmd):
-                        if arg.startswith("youtube:player-client="):
-                            base_cmd[i] = f"{arg};{formats_arg}"
-                            break
-                else:
-                    # Add new extractor args
-                    base_cmd.extend(['--extractor-args', formats_arg])
+                extractor_args.setdefault('youtube', []).append("formats=duplicate")
 
             # Configure PO Token provider if custom settings are provided
-            pot_args = []
             if pot_provider_url:
-                pot_args.append(f"youtubepot-bgutilhttp:base_url={pot_provider_url}")
-                logger.info(f"Using custom PO Token provider URL: {pot_provider_url}")
+                extractor_args.setdefault('youtubepot-bgutilhttp', []).append(f"base_url={pot_provider_url}")
+                logger.info("Using custom PO Token provider URL: %s", pot_provider_url)
             if pot_provider_script:
-                pot_args.append(f"youtubepot-bgutilscript:script_path={pot_provider_script}")
-                logger.info(f"Using custom PO Token provider script: {pot_provider_script}")
-
-            if pot_args:
-                # Combine with existing extractor args
-                existing_yt_args = None
-                for i, arg in enumerate(base_cmd):
-                    if i > 0 and base_cmd[i-1] == '--extractor-args' and 'youtube' in arg:
-                        existing_yt_args = i
-                        break
-
-                for pot_arg in pot_args:
-                    if existing_yt_args is not None:
-                        # Append to existing YouTube extractor args
-                        base_cmd[existing_yt_args] = f"{base_cmd[existing_yt_args]};{pot_arg}"
-                    else:
-                        # Add new extractor args
-                        base_cmd.extend(['--extractor-args', pot_arg])
+                extractor_args.setdefault('youtubepot-bgutilscript', []).append(f"script_path={pot_provider_script}")
+                logger.info("Using custom PO Token provider script: %s", pot_provider_script)
+
+            for extractor, kvs in extractor_args.items():
+                base_cmd.extend(['--extractor-args', f"{extractor}:{';'.join(kvs)}"])
 
         # Add extra arguments
         base_cmd.extend(extra_args)
-        base_cmd.append(url)
-        
-        # Execute download
+        if url is not None:
+            base_cmd.append(url)
+        return base_cmd
+
+    def _execute_download(self, cmd: List[str], platform: str) -> Tuple[bool, Optional[str]]:
+        """
+        Run a single download attempt, adding cookie arguments for the platform.
+        Returns (success, error_output); error_output is None if the attempt timed out.
+        """
         logger.info("Starting download...")
-        try:
-            result = subprocess.run(base_cmd, check=True, timeout=3600)  # 1 hour timeout
-            logger.info("Download completed successfully!")
+        tail: Deque[str] = collections.deque(maxlen=200)
+        with self._cookie_args(platform) as cookie_args:
+            # Echo yt-dlp's stderr live while keeping only its tail for error diagnosis
+            proc = subprocess.Popen([cmd[0], *cookie_args, *cmd[1:]], stderr=subprocess.PIPE,
+                                    text=True, bufsize=1, errors='replace')
+            watchdog = _KillTimer(3600, proc)  # 1 hour timeout
+            watchdog.start()
+            try:
+                for line in proc.stderr:
+                    sys.stderr.write(line)
+                    tail.append(line)
+            finally:
+                proc.stderr.close()
+                try:
+                    returncode = proc.wait()
+                finally:
+                    watchdog.cancel()
+
+        if watchdog.timed_out.is_set():
+            logger.error("Download timed out after 1 hour")
+            return False, None
+
+        if returncode != 0:
+            logger.error(f"Download failed with return code {returncode}")
+            return False, ''.join(tail)
+
+        logger.info("Download completed successfully!")
+        return True, ""
+
+    def _diagnose_download_error(self, error_output: str) -> Tuple[bool, bool]:
+        """
+        Inspect yt-dlp error output from a failed YouTube download.
+        Returns (po_token_error, sabr_related) and logs guidance for each.
+        """
+        # Check for PO Token errors
+        po_token_error = False
+        if _POT_ERROR_RE.search(error_output):
+            po_token_error = True
+
+            # Check if plugin is installed
+            plugin_installed = self._check_pot_plugin_installed()
+
+            if not plugin_installed:
+                logger.warning(
+                    "⚠️  YouTube PO Token required.\n"
+                    "   \n"
+                    "   RECOMMENDED SOLUTION - Install PO Token provider plugin:\n"
+                    "     uv pip install bgutil-ytdlp-pot-provider\n"
+                    "   \n"
+                    "   Then start the HTTP server with Docker:\n"
+                    "     docker run --name bgutil-provider -d -p 4416:4416 --init brainicism/bgutil-ytdlp-pot-provider\n"
+                    "   \n"
+                    "   This automates PO Token generation. See:\n"
+                    "     https://github.com/Brainicism/bgutil-ytdlp-pot-provider\n"
+                    "   \n"
+                    "   Alternative: Try 'mweb' client: --youtube-client mweb"
+                )
+            else:
+                logger.warning(
+                    "⚠️  YouTube PO Token required but provider plugin failed.\n"
+                    "   \n"
+                    "   Make sure the HTTP server is running:\n"
+                    "     docker run --name bgutil-provider -d -p 4416:4416 --init brainicism/bgutil-ytdlp-pot-provider\n"
+                    "   \n"
+                    "   Or try script mode: --pot-provider-mode script\n"
+                    "   Or try 'mweb' client: --youtube-client mweb"
+                )
+
+        # Check if the error might be related to SABR streaming
+        sabr_related = False
+        if _SABR_ERROR_RE.search(error_output):
+            sabr_related = True
+            if not po_token_error:  # Don't duplicate warnings
+                logger.warning("YouTube SABR streaming issue detected")
+
+        return po_token_error, sabr_related
+
+    def download_video(self, url: str, extra_args: Optional[List[str]] = None,
+                      format_selector: Optional[str] = None,
+                      youtube_client: Optional[str] = None,
+                      try_sabr: bool = False,
+                      try_fallback_clients: bool = False,
+                      prefer_premium: bool = True,
+                      sponsorblock_mark: Optional[str] = None,
+                      sponsorblock_remove: Optional[str] = None,
+                      embed_chapters: bool = False,
+                      sleep_interval: Optional[int] = None,
+                      sleep_subtitles: Optional[float] = None,
+                      pot_provider_mode: Optional[str] = None,
+                      pot_provider_url: Optional[str] = None,
+                      pot_provider_script: Optional[str] = None) -> bool:
+        """Download video using yt-dlp with optimized settings."""
+        if extra_args is None:
+            extra_args = []
+        
+        # Detect platform
+        platform = self.detect_platform(url)
+        logger.info(f"Detected platform: {platform.capitalize()}")
+
+        # The metadata/format probes and environment checks are independent and
+        # I/O-bound, so run them concurrently instead of back to back
+        logger.info("Fetching video metadata...")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            info_future = executor.submit(self.get_video_info, url)
+
+            premium_future = None
+            env_futures = []
+            if platform == 'youtube':
+                # Check for premium formats if prefer_premium is enabled
+                if prefer_premium and not format_selector:
+                    premium_future = executor.submit(self.check_premium_formats, url)
+                env_futures.append(executor.submit(self._check_javascript_runtime))
+                env_futures.append(executor.submit(self._check_pot_plugin_installed))
+                if pot_provider_mode != 'script':
+                    env_futures.append(executor.submit(self._check_pot_server_running))
+
+            # The validators below read the memoized probe results, so wait for them first
+            wait(env_futures)
+
+            # Validate YouTube requirements (JavaScript runtime)
+            self._validate_youtube_requirements(platform)
+
+            # Validate and configure PO Token provider for YouTube
+            self._validate_pot_provider(platform, pot_provider_mode)
+
+            if premium_future is not None:
+                premium_format = premium_future.result()
+                if premium_format:
+                    format_selector = premium_format
+                    logger.info(f"Using Premium format: {format_selector}")
+
+            info = info_future.result()
+
+        if format_selector is None:
+            format_selector = DEFAULT_FORMAT_SELECTOR
+
+        # Create output directory
+        title = info.get('title', 'video')
+        date_str = info.get('upload_date') or info.get('release_date')
+        output_dir = self.create_output_dir(title, date_str)
+        logger.info(f"Output directory: {output_dir}")
+
+        # Everything above runs once; only the final download is retried per client
+        build_cmd = functools.partial(
+            self._build_download_cmd, url, format_selector, output_dir, platform,
+            sponsorblock_mark=sponsorblock_mark,
+            sponsorblock_remove=sponsorblock_remove,
+            embed_chapters=embed_chapters,
+            sleep_interval=sleep_interval,
+            sleep_subtitles=sleep_subtitles,
+            pot_provider_url=pot_provider_url,
+            pot_provider_script=pot_provider_script
+        )
+
+        success, error_output = self._execute_download(
+            build_cmd(extra_args, youtube_client=youtube_client, try_sabr=try_sabr), platform)
+        if success:
             return True
-        except subprocess.CalledProcessError as e:
-            error_output = e.stderr if e.stderr else ""
-
-            # Check for PO Token errors
-            po_token_error = False
-            if platform == 'youtube' and any(phrase in error_output for phrase in [
-                "PO Token", "po_token", "requires a GVS PO Token"]):
-                po_token_error = True
-
-                # Check if plugin is installed
-                plugin_installed = self._check_pot_plugin_installed()
-
-                if not plugin_installed:
-                    logger.warning(
-                        "⚠️  YouTube PO Token required.\n"
-                        "   \n"
-                        "   RECOMMENDED SOLUTION - Install PO Token provider plugin:\n"
-                        "     uv pip install bgutil-ytdlp-pot-provider\n"
-                        "   \n"
-                        "   Then start the HTTP server with Docker:\n"
-                        "     docker run --name bgutil-provider -d -p 4416:4416 --init brainicism/bgutil-ytdlp-pot-provider\n"
-                        "   \n"
-                        "   This automates PO Token generation. See:\n"
-                        "     https://github.com/Brainicism/bgutil-ytdlp-pot-provider\n"
-                        "   \n"
-                        "   Alternative: Try 'mweb' client: --youtube-client mweb"
-                    )
-                else:
-                    logger.warning(
-                        "⚠️  YouTube PO Token required but provider plugin failed.\n"
-                        "   \n"
-                        "   Make sure the HTTP server is running:\n"
-                        "     docker run --name bgutil-provider -d -p 4416:4416 --init brainicism/bgutil-ytdlp-pot-provider\n"
-                        "   \n"
-                        "   Or try script mode: --pot-provider-mode script\n"
-                        "   Or try 'mweb' client: --youtube-client mweb"
-                    )
-
-            # Check if the error might be related to SABR streaming
-            sabr_related = False
-            if platform == 'youtube' and any(phrase in error_output for phrase in [
-                "web client https formats require a GVS PO Token",
-                "YouTube is forcing SABR streaming",
-                "only SABR formats"]):
-                sabr_related = True
-                if not po_token_error:  # Don't duplicate warnings
-                    logger.warning("YouTube SABR streaming issue detected")
-            
-            # Try fallback clients for YouTube if enabled and appropriate
-            if platform == 'youtube' and try_fallback_clients and (sabr_related or not youtube_client):
-                available_clients = [c for c in YOUTUBE_CLIENTS if c != youtube_client]
-                
-                for client in available_clients:
-                    logger.info(f"Trying fallback YouTube client: {client}")
-                    # Create new extra_args without any existing YouTube client or format settings
-                    filtered_args = [arg for arg in extra_args if "--extractor-args" not in arg]
-                    
-                    # Try with this client
-                    if self.download_video(
-                        url=url,
-                        extra_args=filtered_args,
-                        format_selector=format_selector,
-                        youtube_client=client,
-                        try_sabr=False,  # Don't try SABR in fallback attempt
-                        try_fallback_clients=False,  # Prevent infinite recursion
-                        sponsorblock_mark=sponsorblock_mark,
-                        sponsorblock_remove=sponsorblock_remove,
-                        embed_chapters=embed_chapters,
-                        sleep_interval=sleep_interval,
-                        sleep_subtitles=sleep_subtitles,
-                        pot_provider_mode=pot_provider_mode,
-                        pot_provider_url=pot_provider_url,
-                        pot_provider_script=pot_provider_script
-                    ):
-                        return True
-                
-                # If SABR might be the only option, try enabling it
-                if sabr_related and not try_sabr:
-                    logger.info("Trying with SABR format support enabled")
-                    filtered_args = [arg for arg in extra_args if "--extractor-args" not in arg]
-
-                    return self.download_video(
-                        url=url,
-                        extra_args=filtered_args,
-                        format_selector=format_selector,
-                        youtube_client=youtube_client or 'web',  # Default to web for SABR
-                        try_sabr=True,  # Enable SABR formats
-                        try_fallback_clients=False,  # Prevent infinite recursion
-                        sponsorblock_mark=sponsorblock_mark,
-                        sponsorblock_remove=sponsorblock_remove,
-                        embed_chapters=embed_chapters,
-                        sleep_interval=sleep_interval,
-                        sleep_subtitles=sleep_subtitles,
-                        pot_provider_mode=pot_provider_mode,
-                        pot_provider_url=pot_provider_url,
-                        pot_provider_script=pot_provider_script
-                    )
-            
-            logger.error(f"Download failed with return code {e.returncode}")
-            if e.stderr:
-                logger.error(f"Error details: {e.stderr}")
+        if error_output is None or platform != 'youtube':
             return False
+
+        _, sabr_related = self._diagnose_download_error(error_output)
+
+        # Try fallback clients for YouTube if enabled and appropriate
+        if not try_fallback_clients or not (sabr_related or not youtube_client):
+            return False
+
+        # Drop any existing YouTube client or format settings from the retries
+        filtered_args = [arg for arg in extra_args if "--extractor-args" not in arg]
+
+        for client in YOUTUBE_CLIENTS:
+            if client == youtube_client:
+                continue
+            logger.info("Trying fallback YouTube client: %s", client)
+            # Don't try SABR in fallback attempts
+            if self._execute_download(build_cmd(filtered_args, youtube_client=client), platform)[0]:
+                return True
+
+        # If SABR might be the only option, try enabling it
+        if sabr_related and not try_sabr:
+            logger.info("Trying with SABR format support enabled")
+            return self._execute_download(build_cmd(
+                filtered_args,
+                youtube_client=youtube_client or 'web',  # Default to web for SABR
+                try_sabr=True
+            ), platform)[0]
+
+        return False
+
+    def download_batch(self, urls: List[str], extra_args: Optional[List[str]] = None,
+                       format_selector: Optional[str] = None,
+                       youtube_client: Optional[str] = None,
+                       try_sabr: bool = False,
+                       sponsorblock_mark: Optional[str] = None,
+                       sponsorblock_remove: Optional[str] = None,
+                       embed_chapters: bool = False,
+                       sleep_interval: Optional[int] = None,
+                       sleep_subtitles: Optional[float] = None,
+                       pot_provider_mode: Optional[str] = None,
+                       pot_provider_url: Optional[str] = None,
+                       pot_provider_script: Optional[str] = None) -> bool:
+        """
+        Download several URLs with a single yt-dlp process fed via `-a -`.
+        Extractor setup and cookie extraction are shared across the batch; per-video
+        Premium detection and client fallbacks are not applied.
+        """
+        if extra_args is None:
+            extra_args = []
+
+        platforms = {self.detect_platform(url) for url in urls}
+        logger.info(f"Batch download: {len(urls)} URLs "
+                    f"({', '.join(p.capitalize() for p in sorted(platforms))})")
+
+        # YouTube-specific checks only need to run once for the whole batch
+        platform = 'youtube' if 'youtube' in platforms else 'other'
+        self._validate_youtube_requirements(platform)
+        self._validate_pot_provider(platform, pot_provider_mode)
+
+        output_root = _DOWNLOADS_DIR
+        try:
+            output_root.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise YtDlpWrapperError(f"Could not create output directory: {e}")
+        logger.info(f"Output directory: {output_root}")
+
+        cmd = self._build_download_cmd(
+            None, format_selector or DEFAULT_FORMAT_SELECTOR, output_root,
+            platform,
+            ['-o', BATCH_OUTPUT_TEMPLATE, '-a', '-', *extra_args],
+            youtube_client=youtube_client,
+            try_sabr=try_sabr,
+            sponsorblock_mark=sponsorblock_mark,
+            sponsorblock_remove=sponsorblock_remove,
+            embed_chapters=embed_chapters,
+            sleep_interval=sleep_interval,
+            sleep_subtitles=sleep_subtitles,
+            pot_provider_url=pot_provider_url,
+            pot_provider_script=pot_provider_script,
+            # A single yt-dlp process reads the browser once anyway; exporting would only add a run
+            cookie_args=['--cookies-from-browser', self.cookies_browser]
+        )
+
+        logger.info("Starting batch download...")
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, text=True)
+        try:
+            proc.communicate('\n'.join(urls) + '\n', timeout=3600 * len(urls))  # 1 hour per URL
         except subprocess.TimeoutExpired:
-            logger.error("Download timed out after 1 hour")
+            proc.kill()
+            proc.wait()
+            logger.error(f"Batch download timed out after {len(urls)} hour(s)")
+            return False
+
+        if proc.returncode != 0:
+            logger.error(f"Batch download finished with errors (return code {proc.returncode})")
             return False
 
+        logger.info("Batch download completed successfully!")
+        return True
+
 
 def main():
     """Main function to handle command line arguments and orchestrate the download."""
@@ -568,10 +917,12 @@ def main():
 Examples:
   %(prog)s "https://www.youtube.com/watch?v=VIDEO_ID"
   %(prog)s "https://twitter.com/user/status/TWEET_ID" --format "best[height<=720]"
+  %(prog)s "https://youtu.be/ID1" "https://youtu.be/ID2" --sleep-interval 5
         """
     )
     
-    parser.add_argument('url', help='URL to download')
+    parser.add_argument('urls', nargs='+', metavar='URL',
+                       help='URL(s) to download (multiple URLs share one yt-dlp process)')
     parser.add_argument('--format', '-f', 
                        help='Custom format selector (overrides default)')
     parser.add_argument('--browser', '-b', default='firefox',
@@ -608,9 +959,13 @@ Examples:
                        help='Custom PO Token provider HTTP server URL (default: http://127.0.0.1:4416)')
     parser.add_argument('--pot-provider-script', metavar='PATH',
                        help='Path to PO Token provider script (for script mode)')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                       help=f'Download up to N URLs concurrently, one yt-dlp process each '
+                            f'(default: 1, max: {MAX_PARALLEL_JOBS})')
 
-    # Parse known and unknown args to allow passing through to yt-dlp
-    args, extra_args = parser.parse_known_args()
+    # Parse known and unknown args to allow passing through to yt-dlp; the intermixed
+    # variant keeps URLs given after options (e.g. "URL1 -f best URL2") in args.urls
+    args, extra_args = parser.parse_known_intermixed_args()
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -622,17 +977,21 @@ Examples:
     # Add compat-options to extra_args if specified
     if args.compat_options:
         extra_args.extend(['--compat-options', args.compat_options])
+
+    jobs = args.jobs
+    if jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if jobs > MAX_PARALLEL_JOBS:
+        logger.warning(f"Limiting --jobs to {MAX_PARALLEL_JOBS} to avoid YouTube rate limits")
+        jobs = MAX_PARALLEL_JOBS
     
     try:
         downloader = VideoDownloader(cookies_browser=args.browser)
-        success = downloader.download_video(
-            args.url,
+        download_kwargs = dict(
             extra_args=extra_args,
             format_selector=args.format,
             youtube_client=args.youtube_client,
             try_sabr=args.enable_sabr,
-            try_fallback_clients=not args.no_fallback,
-            prefer_premium=not args.no_premium,
             sponsorblock_mark=args.sponsorblock_mark,
             sponsorblock_remove=args.sponsorblock_remove,
             embed_chapters=args.embed_chapters,
@@ -642,7 +1001,25 @@ Examples:
             pot_provider_url=args.pot_provider_url,
             pot_provider_script=args.pot_provider_script
         )
-        
+
+        if len(args.urls) == 1 or jobs > 1:
+            download = functools.partial(
+                downloader.download_video,
+                try_fallback_clients=not args.no_fallback,
+                prefer_premium=not args.no_premium,
+                **download_kwargs
+            )
+            if len(args.urls) == 1:
+                success = download(args.urls[0])
+            else:
+                # Each download is its own yt-dlp process, so threads are enough to fan out
+                workers = min(jobs, len(args.urls))
+                logger.info(f"Downloading {len(args.urls)} URLs with {workers} parallel jobs")
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    success = all(list(executor.map(download, args.urls)))
+        else:
+            success = downloader.download_batch(args.urls, **download_kwargs)
+
         sys.exit(0 if success else 1)
         
     except YtDlpWrapperError as e: